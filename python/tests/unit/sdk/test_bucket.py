@@ -1,4 +1,6 @@
 import unittest
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
 from unittest import mock
 from unittest.mock import Mock, call, patch
 
@@ -32,6 +34,7 @@ from aistore.sdk.const import (
     HTTP_METHOD_PUT,
     HTTP_METHOD_POST,
     URL_PATH_BUCKETS,
+    URL_PATH_OBJECTS,
     HEADER_ACCEPT,
     HEADER_BUCKET_PROPS,
     HEADER_XACTION_ID,
@@ -58,20 +61,85 @@ from aistore.sdk.types import (
     TransformBckMsg,
     CopyBckMsg,
 )
+from tests.unit.sdk.test_utils import test_cases
 
 BCK_NAME = "bucket_name"
+_BCK_PATH = f"{URL_PATH_BUCKETS}/{BCK_NAME}"
+_OBJ_PATH_PREFIX = f"{URL_PATH_OBJECTS}/{BCK_NAME}/"
+
+_NS = Namespace(uuid="ns-id", name="ns-name")
+_E1 = BucketEntry(n="entry1")
+_E2 = BucketEntry(n="entry2")
+_E3 = BucketEntry(n="entry3")
+_LIST_EMPTY = BucketList(UUID="empty", ContinuationToken="", Flags=0)
+_LIST_1 = BucketList(UUID="123", ContinuationToken="cont", Flags=0, Entries=[_E1])
+_LIST_2 = BucketList(UUID="456", ContinuationToken="", Flags=0, Entries=[_E2, _E3])
+
+_CREATE_BCK_JSON = ActionMsg(action=ACT_CREATE_BCK).dict()
+_DESTROY_BCK_JSON = ActionMsg(action=ACT_DESTROY_BCK).dict()
+_MOVE_BCK_JSON = ActionMsg(action=ACT_MOVE_BCK).dict()
+_EVICT_JSON = ActionMsg(action=ACT_EVICT_REMOTE_BCK).dict()
+
+
+@lru_cache(maxsize=None)
+def _bck_to(provider, name):
+    """Expected QPARAM_BCK_TO value for a destination bucket without a namespace."""
+    return f"{provider}/@#/{name}/"
+
+
+@lru_cache(maxsize=None)
+def _action_json(action, value_items=None):
+    """Cached ActionMsg payload, keyed by a hashable tuple of the value's items."""
+    value = dict(value_items) if value_items is not None else None
+    return ActionMsg(action=action, value=value).dict()
 
 
 # pylint: disable=too-many-public-methods,unused-variable
 class TestBucket(unittest.TestCase):
-    def setUp(self) -> None:
-        self.mock_client = Mock(RequestClient)
-        self.amz_bck = Bucket(
-            name=BCK_NAME, client=self.mock_client, provider=PROVIDER_AMAZON
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.mock_client = Mock()
+        cls.amz_bck = Bucket(
+            name=BCK_NAME, client=cls.mock_client, provider=PROVIDER_AMAZON
         )
-        self.amz_bck_params = self.amz_bck.qparam.copy()
-        self.ais_bck = Bucket(name=BCK_NAME, client=self.mock_client)
-        self.ais_bck_params = self.ais_bck.qparam.copy()
+        cls.ais_bck = Bucket(name=BCK_NAME, client=cls.mock_client)
+        # Read-only baselines; build per-test expectations with {**baseline, key: val}
+        cls._AMZ_QP = MappingProxyType(dict(cls.amz_bck.qparam))
+        cls._AIS_QP = MappingProxyType(dict(cls.ais_bck.qparam))
+        # File system access used by put_files, patched once for the whole class.
+        # Path is patched only where bucket.py looks it up, not on pathlib itself.
+        cls._patchers = []
+        cls._mocks = {}
+        try:
+            for target in (
+                "aistore.sdk.object.read_file_bytes",
+                "aistore.sdk.object.validate_file",
+                "aistore.sdk.bucket.validate_directory",
+                "aistore.sdk.bucket.Path",
+            ):
+                patcher = patch(target)
+                cls._mocks[target] = patcher.start()
+                cls._patchers.append(patcher)
+        except Exception:
+            cls._stop_patchers()
+            raise
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._stop_patchers()
+
+    @classmethod
+    def _stop_patchers(cls):
+        while cls._patchers:
+            cls._patchers.pop().stop()
+
+    def setUp(self) -> None:
+        self.mock_client.reset_mock()
+        # Before Python 3.9, reset_mock doesn't pass these flags down to child mocks
+        for child in (self.mock_client.request, self.mock_client.request_deserialize):
+            child.reset_mock(return_value=True, side_effect=True)
+        for patched in self._mocks.values():
+            patched.reset_mock(return_value=True, side_effect=True)
 
     def test_default_props(self):
         bucket = Bucket(name=BCK_NAME, client=self.mock_client)
@@ -81,37 +149,40 @@ class TestBucket(unittest.TestCase):
 
     def test_properties(self):
         self.assertEqual(self.mock_client, self.ais_bck.client)
-        expected_ns = Namespace(uuid="ns-id", name="ns-name")
         client = RequestClient("test client name", skip_verify=False, ca_cert="")
         bck = Bucket(
             client=client,
             name=BCK_NAME,
             provider=PROVIDER_AMAZON,
-            namespace=expected_ns,
+            namespace=_NS,
         )
         self.assertEqual(client, bck.client)
         self.assertEqual(PROVIDER_AMAZON, bck.provider)
         self.assertEqual(
             {
                 QPARAM_PROVIDER: PROVIDER_AMAZON,
-                QPARAM_NAMESPACE: expected_ns.get_path(),
+                QPARAM_NAMESPACE: _NS.get_path(),
             },
             bck.qparam,
         )
         self.assertEqual(BCK_NAME, bck.name)
-        self.assertEqual(expected_ns, bck.namespace)
+        self.assertIs(_NS, bck.namespace)
 
     def test_ais_source(self):
         self.assertIsInstance(self.ais_bck, AISSource)
 
-    def test_create_invalid_provider(self):
-        self.assertRaises(InvalidBckProvider, self.amz_bck.create)
+    @test_cases(("create",), ("rename", "new_name"), ("delete",), ("evict",))
+    def test_invalid_provider(self, test_case):
+        operation, *args = test_case
+        # Evict is only valid for remote buckets, everything else only for AIS buckets
+        bck = self.ais_bck if operation == "evict" else self.amz_bck
+        self.assertRaises(InvalidBckProvider, getattr(bck, operation), *args)
 
     def _assert_bucket_created(self, bck):
         self.mock_client.request.assert_called_with(
             HTTP_METHOD_POST,
-            path=f"{URL_PATH_BUCKETS}/{BCK_NAME}",
-            json=ActionMsg(action=ACT_CREATE_BCK).dict(),
+            path=_BCK_PATH,
+            json=_CREATE_BCK_JSON,
             params=self.ais_bck.qparam,
         )
         self.assertIsInstance(bck, Bucket)
@@ -129,37 +200,36 @@ class TestBucket(unittest.TestCase):
         res = self.ais_bck.create(exist_ok=True)
         self._assert_bucket_created(res)
 
-    def test_rename_invalid_provider(self):
-        self.assertRaises(InvalidBckProvider, self.amz_bck.rename, "new_name")
-
     def test_rename_success(self):
         new_bck_name = "new_bucket"
         expected_response = "rename_op_123"
-        self.ais_bck_params[QPARAM_BCK_TO] = f"{PROVIDER_AIS}/@#/{new_bck_name}/"
+        expected_params = {
+            **self._AIS_QP,
+            QPARAM_BCK_TO: _bck_to(PROVIDER_AIS, new_bck_name),
+        }
         mock_response = Mock()
         mock_response.text = expected_response
         self.mock_client.request.return_value = mock_response
+        # Rename mutates the bucket, so don't touch the shared class-level instance
+        bck = Bucket(name=BCK_NAME, client=self.mock_client)
 
-        response = self.ais_bck.rename(new_bck_name)
+        response = bck.rename(new_bck_name)
 
         self.assertEqual(expected_response, response)
         self.mock_client.request.assert_called_with(
             HTTP_METHOD_POST,
-            path=f"{URL_PATH_BUCKETS}/{BCK_NAME}",
-            json=ActionMsg(action=ACT_MOVE_BCK).dict(),
-            params=self.ais_bck_params,
+            path=_BCK_PATH,
+            json=_MOVE_BCK_JSON,
+            params=expected_params,
         )
-        self.assertEqual(self.ais_bck.name, new_bck_name)
-
-    def test_delete_invalid_provider(self):
-        self.assertRaises(InvalidBckProvider, self.amz_bck.delete)
+        self.assertEqual(bck.name, new_bck_name)
 
     def test_delete_success(self):
         self.ais_bck.delete()
         self.mock_client.request.assert_called_with(
             HTTP_METHOD_DELETE,
-            path=f"{URL_PATH_BUCKETS}/{BCK_NAME}",
-            json=ActionMsg(action=ACT_DESTROY_BCK).dict(),
+            path=_BCK_PATH,
+            json=_DESTROY_BCK_JSON,
             params=self.ais_bck.qparam,
         )
 
@@ -170,24 +240,26 @@ class TestBucket(unittest.TestCase):
         self.ais_bck.delete(missing_ok=True)
         self.mock_client.request.assert_called_with(
             HTTP_METHOD_DELETE,
-            path=f"{URL_PATH_BUCKETS}/{BCK_NAME}",
-            json=ActionMsg(action=ACT_DESTROY_BCK).dict(),
+            path=_BCK_PATH,
+            json=_DESTROY_BCK_JSON,
             params=self.ais_bck.qparam,
         )
 
-    def test_evict_invalid_provider(self):
-        self.assertRaises(InvalidBckProvider, self.ais_bck.evict)
-
     def test_evict_success(self):
+        expected_params = {
+            keep_md: {**self._AMZ_QP, QPARAM_KEEP_REMOTE: str(keep_md)}
+            for keep_md in (True, False)
+        }
         for keep_md in [True, False]:
-            self.amz_bck_params[QPARAM_KEEP_REMOTE] = str(keep_md)
-            self.amz_bck.evict(keep_md=keep_md)
-            self.mock_client.request.assert_called_with(
-                HTTP_METHOD_DELETE,
-                path=f"{URL_PATH_BUCKETS}/{BCK_NAME}",
-                json=ActionMsg(action=ACT_EVICT_REMOTE_BCK).dict(),
-                params=self.amz_bck_params,
-            )
+            with self.subTest(keep_md=keep_md):
+                self.mock_client.request.reset_mock()
+                self.amz_bck.evict(keep_md=keep_md)
+                self.mock_client.request.assert_called_once_with(
+                    HTTP_METHOD_DELETE,
+                    path=_BCK_PATH,
+                    json=_EVICT_JSON,
+                    params=expected_params[keep_md],
+                )
 
     def test_head(self):
         mock_header = Mock()
@@ -196,19 +268,19 @@ class TestBucket(unittest.TestCase):
         headers = self.ais_bck.head()
         self.mock_client.request.assert_called_with(
             HTTP_METHOD_HEAD,
-            path=f"{URL_PATH_BUCKETS}/{BCK_NAME}",
+            path=_BCK_PATH,
             params=self.ais_bck.qparam,
         )
         self.assertEqual(headers, mock_header.headers)
 
-    def test_copy_default_params(self):
+    def test_copy(self):
         dest_bck = Bucket(
             client=self.mock_client,
             name="test-bck",
-            namespace=Namespace(uuid="namespace-id", name="ns-name"),
+            namespace=_NS,
             provider="any-provider",
         )
-        action_value = {
+        default_value = {
             "prefix": "",
             "prepend": "",
             "dry_run": False,
@@ -216,110 +288,104 @@ class TestBucket(unittest.TestCase):
             "latest-ver": False,
             "synchronize": False,
         }
-        self._copy_exec_assert(dest_bck, action_value)
-
-    def test_copy(self):
         prefix_filter = "existing-"
         prepend_val = "prefix-"
-        dry_run = True
-        force = True
-        latest = False
-        sync = False
-        action_value = {
+        full_kwargs = {
+            "prefix_filter": prefix_filter,
+            "prepend": prepend_val,
+            "dry_run": True,
+            "force": True,
+        }
+        full_value = {
             "prefix": prefix_filter,
             "prepend": prepend_val,
-            "dry_run": dry_run,
-            "force": force,
-            "latest-ver": latest,
-            "synchronize": sync,
+            "dry_run": True,
+            "force": True,
+            "latest-ver": False,
+            "synchronize": False,
         }
-
-        self._copy_exec_assert(
-            self.ais_bck,
-            action_value,
-            prefix_filter=prefix_filter,
-            prepend=prepend_val,
-            dry_run=dry_run,
-            force=force,
-        )
+        cases = [
+            (dest_bck, {}, default_value),
+            (self.ais_bck, full_kwargs, full_value),
+        ]
+        for to_bck, kwargs, expected_act_value in cases:
+            with self.subTest(to_bck=to_bck.name, kwargs=kwargs):
+                self.mock_client.request.reset_mock()
+                self._copy_exec_assert(to_bck, expected_act_value, **kwargs)
 
     def _copy_exec_assert(self, to_bck, expected_act_value, **kwargs):
         expected_response = "copy-action-id"
         mock_response = Mock()
         mock_response.text = expected_response
         self.mock_client.request.return_value = mock_response
-        self.ais_bck_params[QPARAM_BCK_TO] = to_bck.get_path()
-        expected_action = ActionMsg(
-            action=ACT_COPY_BCK, value=expected_act_value
-        ).dict()
+        expected_action = _action_json(
+            ACT_COPY_BCK, tuple(sorted(expected_act_value.items()))
+        )
 
         job_id = self.ais_bck.copy(to_bck=to_bck, **kwargs)
 
         self.assertEqual(expected_response, job_id)
         self.mock_client.request.assert_called_with(
             HTTP_METHOD_POST,
-            path=f"{URL_PATH_BUCKETS}/{BCK_NAME}",
+            path=_BCK_PATH,
             json=expected_action,
-            params=self.ais_bck_params,
-        )
-
-    def test_list_objects(self):
-        prefix = "prefix-"
-        page_size = 0
-        uuid = "1234"
-        props = "name"
-        continuation_token = "token"
-        flags = [ListObjectFlag.CACHED, ListObjectFlag.DELETED]
-        flag_value = "5"
-        target_id = "target-node"
-        expected_act_value = {
-            "prefix": prefix,
-            "pagesize": page_size,
-            "uuid": uuid,
-            "props": props,
-            "continuation_token": continuation_token,
-            "flags": flag_value,
-            "target": target_id,
-        }
-        self._list_objects_exec_assert(
-            expected_act_value,
-            prefix=prefix,
-            page_size=page_size,
-            uuid=uuid,
-            props=props,
-            continuation_token=continuation_token,
-            flags=flags,
-            target=target_id,
+            params={**self._AIS_QP, QPARAM_BCK_TO: to_bck.get_path()},
         )
 
-    def test_list_objects_default_params(self):
-        expected_act_value = {
-            "prefix": "",
-            "pagesize": 0,
-            "uuid": "",
-            "props": "",
-            "continuation_token": "",
-            "flags": "0",
-            "target": "",
-        }
-        self._list_objects_exec_assert(expected_act_value)
+    @test_cases(
+        (
+            {},
+            {
+                "prefix": "",
+                "pagesize": 0,
+                "uuid": "",
+                "props": "",
+                "continuation_token": "",
+                "flags": "0",
+                "target": "",
+            },
+        ),
+        (
+            {
+                "prefix": "prefix-",
+                "page_size": 0,
+                "uuid": "1234",
+                "props": "name",
+                "continuation_token": "token",
+                "flags": [ListObjectFlag.CACHED, ListObjectFlag.DELETED],
+                "target": "target-node",
+            },
+            {
+                "prefix": "prefix-",
+                "pagesize": 0,
+                "uuid": "1234",
+                "props": "name",
+                "continuation_token": "token",
+                "flags": "5",
+                "target": "target-node",
+            },
+        ),
+    )
+    def test_list_objects(self, test_case):
+        kwargs, expected_act_value = test_case
+        self.mock_client.request_deserialize.reset_mock()
+        self._list_objects_exec_assert(expected_act_value, **kwargs)
 
     def _list_objects_exec_assert(self, expected_act_value, **kwargs):
-        action = ActionMsg(action=ACT_LIST, value=expected_act_value).dict()
+        action = _action_json(ACT_LIST, tuple(sorted(expected_act_value.items())))
 
         object_names = ["obj_name", "obj_name2"]
         bucket_entries = [BucketEntry(n=name) for name in object_names]
-        mock_list = Mock(BucketList)
-        mock_list.entries = bucket_entries
+        mock_list = SimpleNamespace(entries=bucket_entries)
         self.mock_client.request_deserialize.return_value = mock_list
         result = self.ais_bck.list_objects(**kwargs)
         self.mock_client.request_deserialize.assert_called_with(
             HTTP_METHOD_GET,
-            path=f"{URL_PATH_BUCKETS}/{BCK_NAME}",
+            path=_BCK_PATH,
             headers={HEADER_ACCEPT: MSGPACK_CONTENT_TYPE},
             res_model=BucketList,
             json=action,
-            params=self.ais_bck_params,
+            params=self._AIS_QP,
         )
         self.assertEqual(result, mock_list)
         self.assertEqual(object_names, [entry.object.name for entry in result.entries])
@@ -328,168 +394,128 @@ class TestBucket(unittest.TestCase):
         self.assertIsInstance(
             self.ais_bck.list_objects_iter("prefix-", "obj props", 123), ObjectIterator
         )
-
-    def test_list_all_objects(self):
-        list_1_id = "123"
-        list_1_cont = "cont"
-        prefix = "prefix-"
-        page_size = 5
-        props = "name"
-        flags = [ListObjectFlag.CACHED, ListObjectFlag.DELETED]
-        flag_value = "5"
-        target_id = "target-node"
+        # The iterator must be lazy: no page is fetched until it's iterated
+        self.mock_client.request_deserialize.assert_not_called()
+
+    @test_cases(
+        (
+            {},
+            {"prefix": "", "pagesize": 0, "props": "", "flags": "0", "target": ""},
+        ),
+        (
+            {
+                "prefix": "prefix-",
+                "page_size": 5,
+                "props": "name",
+                "flags": [ListObjectFlag.CACHED, ListObjectFlag.DELETED],
+                "target": "target-node",
+            },
+            {
+                "prefix": "prefix-",
+                "pagesize": 5,
+                "props": "name",
+                "flags": "5",
+                "target": "target-node",
+            },
+        ),
+    )
+    def test_list_all_objects(self, test_case):
+        kwargs, expected_act_base = test_case
+        # Only the paging state differs between the first and second request
         expected_act_value_1 = {
-            "prefix": prefix,
-            "pagesize": page_size,
+            **expected_act_base,
             "uuid": "",
-            "props": props,
             "continuation_token": "",
-            "flags": flag_value,
-            "target": target_id,
         }
         expected_act_value_2 = {
-            "prefix": prefix,
-            "pagesize": page_size,
-            "uuid": list_1_id,
-            "props": props,
-            "continuation_token": list_1_cont,
-            "flags": flag_value,
-            "target": target_id,
+            **expected_act_base,
+            "uuid": _LIST_1.uuid,
+            "continuation_token": _LIST_1.continuation_token,
         }
-        self._list_all_objects_exec_assert(
-            list_1_id,
-            list_1_cont,
-            expected_act_value_1,
-            expected_act_value_2,
-            prefix=prefix,
-            page_size=page_size,
-            props=props,
-            flags=flags,
-            target=target_id,
+        self.mock_client.request_deserialize.reset_mock(
+            return_value=True, side_effect=True
         )
-
-    def test_list_all_objects_default_params(self):
-        list_1_id = "123"
-        list_1_cont = "cont"
-        expected_act_value_1 = {
-            "prefix": "",
-            "pagesize": 0,
-            "uuid": "",
-            "props": "",
-            "continuation_token": "",
-            "flags": "0",
-            "target": "",
-        }
-        expected_act_value_2 = {
-            "prefix": "",
-            "pagesize": 0,
-            "uuid": list_1_id,
-            "props": "",
-            "continuation_token": list_1_cont,
-            "flags": "0",
-            "target": "",
-        }
         self._list_all_objects_exec_assert(
-            list_1_id, list_1_cont, expected_act_value_1, expected_act_value_2
+            expected_act_value_1, expected_act_value_2, **kwargs
         )
 
     def _list_all_objects_exec_assert(
-        self,
-        list_1_id,
-        list_1_cont,
-        expected_act_value_1,
-        expected_act_value_2,
-        **kwargs,
+        self, expected_act_value_1, expected_act_value_2, **kwargs
     ):
-        entry_1 = BucketEntry(n="entry1")
-        entry_2 = BucketEntry(n="entry2")
-        entry_3 = BucketEntry(n="entry3")
-        list_1 = BucketList(
-            UUID=list_1_id, ContinuationToken=list_1_cont, Flags=0, Entries=[entry_1]
-        )
-        list_2 = BucketList(
-            UUID="456", ContinuationToken="", Flags=0, Entries=[entry_2, entry_3]
-        )
-
         # Test with empty list of entries
-        self.mock_client.request_deserialize.return_value = BucketList(
-            UUID="empty", ContinuationToken="", Flags=0
-        )
+        self.mock_client.request_deserialize.return_value = _LIST_EMPTY
 
         self.assertEqual([], self.ais_bck.list_all_objects(**kwargs))
 
         # Test with non-empty lists
-        self.mock_client.request_deserialize.side_effect = [list_1, list_2]
-        self.assertEqual(
-            [entry_1, entry_2, entry_3], self.ais_bck.list_all_objects(**kwargs)
-        )
+        self.mock_client.request_deserialize.reset_mock()
+        self.mock_client.request_deserialize.side_effect = (_LIST_1, _LIST_2)
+        self.assertEqual([_E1, _E2, _E3], self.ais_bck.list_all_objects(**kwargs))
 
         expected_calls = []
         for expected_val in [expected_act_value_1, expected_act_value_2]:
             expected_calls.append(
                 mock.call(
                     HTTP_METHOD_GET,
-                    path=f"{URL_PATH_BUCKETS}/{BCK_NAME}",
+                    path=_BCK_PATH,
                     headers={HEADER_ACCEPT: MSGPACK_CONTENT_TYPE},
                     res_model=BucketList,
-                    json=ActionMsg(action=ACT_LIST, value=expected_val).dict(),
-                    params=self.ais_bck_params,
+                    json=_action_json(ACT_LIST, tuple(sorted(expected_val.items()))),
+                    params=self._AIS_QP,
                 )
             )
 
-        for expected in expected_calls:
-            self.assertIn(expected, self.mock_client.request_deserialize.call_args_list)
+        self.assertEqual(
+            expected_calls, self.mock_client.request_deserialize.call_args_list
+        )
 
     def test_transform(self):
         etl_name = "etl-name"
+        default_value = {
+            "id": etl_name,
+            "prefix": "",
+            "prepend": "",
+            "force": False,
+            "dry_run": False,
+            "request_timeout": DEFAULT_ETL_TIMEOUT,
+            "latest-ver": False,
+            "synchronize": False,
+        }
         prepend_val = "prefix-"
         prefix_filter = "required-prefix-"
         ext = {"jpg": "txt"}
         timeout = "4m"
-        force = True
-        dry_run = True
-        action_value = TCBckMsg(
+        full_kwargs = {
+            "prepend": prepend_val,
+            "prefix_filter": prefix_filter,
+            "ext": ext,
+            "force": True,
+            "dry_run": True,
+            "timeout": timeout,
+        }
+        full_value = TCBckMsg(
             ext=ext,
             transform_msg=TransformBckMsg(etl_name=etl_name, timeout=timeout),
             copy_msg=CopyBckMsg(
                 prefix=prefix_filter,
                 prepend=prepend_val,
-                force=force,
-                dry_run=dry_run,
+                force=True,
+                dry_run=True,
                 latest=False,
                 sync=False,
             ),
         ).as_dict()
-
-        self._transform_exec_assert(
-            etl_name,
-            action_value,
-            prepend=prepend_val,
-            prefix_filter=prefix_filter,
-            ext=ext,
-            force=force,
-            dry_run=dry_run,
-            timeout=timeout,
-        )
-
-    def test_transform_default_params(self):
-        etl_name = "etl-name"
-        action_value = {
-            "id": etl_name,
-            "prefix": "",
-            "prepend": "",
-            "force": False,
-            "dry_run": False,
-            "request_timeout": DEFAULT_ETL_TIMEOUT,
-            "latest-ver": False,
-            "synchronize": False,
-        }
-
-        self._transform_exec_assert(etl_name, action_value)
+        for kwargs, expected_act_value in [
+            ({}, default_value),
+            (full_kwargs, full_value),
+        ]:
+            with self.subTest(kwargs=kwargs):
+                self.mock_client.request.reset_mock()
+                self._transform_exec_assert(etl_name, expected_act_value, **kwargs)
 
     def _transform_exec_assert(self, etl_name, expected_act_value, **kwargs):
         to_bck = Bucket(name="new-bucket")
-        self.ais_bck_params[QPARAM_BCK_TO] = to_bck.get_path()
+        # Transform values can hold nested dicts (e.g. "ext"), so they aren't hashable
         expected_action = ActionMsg(action=ACT_ETL_BCK, value=expected_act_value).dict()
         expected_response = "job-id"
         mock_response = Mock()
@@ -500,9 +526,9 @@ class TestBucket(unittest.TestCase):
 
         self.mock_client.request.assert_called_with(
             HTTP_METHOD_POST,
-            path=f"{URL_PATH_BUCKETS}/{BCK_NAME}",
+            path=_BCK_PATH,
             json=expected_action,
-            params=self.ais_bck_params,
+            params={**self._AIS_QP, QPARAM_BCK_TO: _bck_to(PROVIDER_AIS, to_bck.name)},
         )
         self.assertEqual(expected_response, result_id)
 
@@ -510,13 +536,7 @@ class TestBucket(unittest.TestCase):
         new_obj = self.ais_bck.object(obj_name="name")
         self.assertEqual(self.ais_bck, new_obj.bucket)
 
-    @patch("aistore.sdk.object.read_file_bytes")
-    @patch("aistore.sdk.object.validate_file")
-    @patch("aistore.sdk.bucket.validate_directory")
-    @patch("pathlib.Path.glob")
-    def test_put_files(
-        self, mock_glob, mock_validate_dir, mock_validate_file, mock_read
-    ):
+    def test_put_files(self):
         path = "directory"
         file_1_name = "file_1_name"
         file_2_name = "file_2_name"
@@ -530,37 +550,40 @@ class TestBucket(unittest.TestCase):
         path_2.stat.return_value = Mock(st_size=4567)
         file_1_data = b"bytes in the first file"
         file_2_data = b"bytes in the second file"
-        mock_glob.return_value = [path_1, path_2]
-        expected_obj_names = [file_1_name, file_2_name]
+
+        mock_read = self._mocks["aistore.sdk.object.read_file_bytes"]
+        mock_validate_file = self._mocks["aistore.sdk.object.validate_file"]
+        mock_validate_dir = self._mocks["aistore.sdk.bucket.validate_directory"]
+        mock_path = self._mocks["aistore.sdk.bucket.Path"]
+        mock_path.return_value = Mock(glob=Mock(return_value=[path_1, path_2]))
         mock_read.side_effect = [file_1_data, file_2_data]
 
         res = self.ais_bck.put_files(path)
 
         mock_validate_dir.assert_called_with(path)
-        mock_validate_file.assert_has_calls([call(str(path_1)), call(str(path_2))])
-        self.assertEqual(expected_obj_names, res)
+        self.assertEqual(
+            [call(str(path_1)), call(str(path_2))], mock_validate_file.call_args_list
+        )
+        self.assertEqual([file_1_name, file_2_name], res)
         expected_calls = [
             call(
                 HTTP_METHOD_PUT,
-                path=f"objects/{BCK_NAME}/{file_1_name}",
-                params=self.ais_bck_params,
+                path=_OBJ_PATH_PREFIX + file_1_name,
+                params=self._AIS_QP,
                 data=file_1_data,
             ),
             call(
                 HTTP_METHOD_PUT,
-                path=f"objects/{BCK_NAME}/{file_2_name}",
-                params=self.ais_bck_params,
+                path=_OBJ_PATH_PREFIX + file_2_name,
+                params=self._AIS_QP,
                 data=file_2_data,
             ),
         ]
-        self.mock_client.request.assert_has_calls(expected_calls)
+        self.assertEqual(expected_calls, self.mock_client.request.call_args_list)
 
     def test_get_path(self):
-        namespace = Namespace(uuid="ns-id", name="ns-name")
-        bucket = Bucket(name=BCK_NAME, namespace=namespace, provider=PROVIDER_AMAZON)
-        expected_path = (
-            f"{PROVIDER_AMAZON}/@{namespace.uuid}#{namespace.name}/{bucket.name}/"
-        )
+        bucket = Bucket(name=BCK_NAME, namespace=_NS, provider=PROVIDER_AMAZON)
+        expected_path = f"{PROVIDER_AMAZON}/@{_NS.uuid}#{_NS.name}/{bucket.name}/"
         self.assertEqual(expected_path, bucket.get_path())
         self.assertEqual(f"{PROVIDER_AIS}/@#/{bucket.name}/", self.ais_bck.get_path())
 
@@ -591,7 +614,7 @@ class TestBucket(unittest.TestCase):
         self.ais_bck.make_request(method, action)
         self.mock_client.request.assert_called_with(
             method,
-            path=f"{URL_PATH_BUCKETS}/{BCK_NAME}",
+            path=_BCK_PATH,
             json=ActionMsg(action=action, value=None).dict(),
             params=self.ais_bck.qparam,
         )
@@ -604,7 +627,7 @@ class TestBucket(unittest.TestCase):
         self.ais_bck.make_request(method, action, value, params)
         self.mock_client.request.assert_called_with(
             method,
-            path=f"{URL_PATH_BUCKETS}/{BCK_NAME}",
+            path=_BCK_PATH,
             json=ActionMsg(action=action, value=value).dict(),
             params=params,
         )
@@ -642,13 +665,13 @@ class TestBucket(unittest.TestCase):
         calls = [
             call(
                 HTTP_METHOD_GET,
-                path="buckets/bucket_name",
+                path=_BCK_PATH,
                 json={"action": ACT_SUMMARY_BCK, "name": "", "value": bsumm_ctrl_msg},
                 params=self.ais_bck.qparam,
             ),
             call(
                 HTTP_METHOD_GET,
-                path="buckets/bucket_name",
+                path=_BCK_PATH,
                 json={
                     "action": ACT_SUMMARY_BCK,
                     "name": "",
@@ -710,7 +733,7 @@ class TestBucket(unittest.TestCase):
         calls = [
             call(
                 HTTP_METHOD_HEAD,
-                path=f"{URL_PATH_BUCKETS}/{self.ais_bck.name}",
+                path=_BCK_PATH,
                 params={
                     **self.ais_bck.qparam,
                     QPARAM_FLT_PRESENCE: 0,
@@ -720,7 +743,7 @@ class TestBucket(unittest.TestCase):
             ),
             call(
                 HTTP_METHOD_HEAD,
-                path=f"{URL_PATH_BUCKETS}/{self.ais_bck.name}",
+                path=_BCK_PATH,
                 params={
                     **self.ais_bck.qparam,
                     QPARAM_FLT_PRESENCE: 0,